@@ -12,13 +12,25 @@ Usage:
 
 from __future__ import annotations
 
+import mmap
 import os
+import re
+import stat
 import sys
 import time
 import math
+from collections import Counter
 from typing import List, Tuple, Optional
 
 
+# Commas and whitespace both separate values; mapping commas to spaces lets
+# a single str.split() tokenize each line.
+COMMA_TO_SPACE = str.maketrans(",", " ")
+
+# The same separators, as a byte pattern matching one value token.
+VALUE_TOKEN = re.compile(rb"[^,\s]+")
+
+
 def get_results_file_path() -> str:
     """
     Build the absolute path for the results file.
@@ -39,54 +51,90 @@ def get_results_file_path() -> str:
     return results_path
 
 
-def parse_numbers_from_file(path: str) -> Tuple[List[float], List[str]]:
+def parse_numbers_by_line(
+    text: str,
+    base_name: str,
+) -> Tuple[List[float], List[str]]:
     """
-    Parse numeric values from a file.
+    Parse numeric values line by line, reporting each invalid token.
 
     Invalid data is reported and skipped.
     """
     numbers: List[float] = []
     errors: List[str] = []
 
+    for line_no, line in enumerate(text.split("\n"), start=1):
+        for token in line.translate(COMMA_TO_SPACE).split():
+            try:
+                numbers.append(float(token))
+            except ValueError:
+                errors.append(
+                    f"{base_name} - line {line_no}: "
+                    f"'{token}' skipped"
+                )
+
+    return numbers, errors
+
+
+def read_mapped_tokens(path: str) -> Optional[List[bytes]]:
+    """
+    Return the value tokens of a file.
+
+    The file is scanned through a read-only memory map, so its bytes are
+    matched straight from the page cache without being decoded into a str.
+    Returns None for pipes and other non-regular files, which cannot be
+    mapped and may report a size of 0 while still holding data.
+    """
+    with open(path, "rb") as file:
+        file_stat = os.fstat(file.fileno())
+        if not stat.S_ISREG(file_stat.st_mode):
+            return None
+        if file_stat.st_size == 0:
+            return []
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return VALUE_TOKEN.findall(data)
+
+
+def parse_numbers_from_file(path: str) -> Tuple[List[float], List[str]]:
+    """
+    Parse numeric values from a file.
+
+    The whole file is tokenized and converted in one pass; only when it
+    holds an invalid token is it read again line by line to report errors.
+    Invalid data is reported and skipped.
+    """
     try:
+        tokens = read_mapped_tokens(path)
+        if tokens is not None:
+            try:
+                return list(map(float, tokens)), []
+            except ValueError:
+                pass
+
         with open(path, "r", encoding="utf-8") as file:
-            line_no = 0
-            for raw_line in file:
-                line_no += 1
-                line = raw_line.strip()
-
-                if not line:
-                    continue
-
-                parts = line.split(",")
-                tokens: List[str] = []
-                for part in parts:
-                    tokens.extend(part.split())
-
-                for token in tokens:
-                    try:
-                        numbers.append(float(token))
-                    except ValueError:
-                        errors.append(
-                            f"{os.path.basename(path)} - line {line_no}: "
-                            f"'{token}' skipped"
-                        )
+            text = file.read()
     except FileNotFoundError:
-        errors.append(f"File not found: {path}")
+        return [], [f"File not found: {path}"]
     except OSError as exc:
-        errors.append(f"Could not read file '{path}': {exc}")
+        return [], [f"Could not read file '{path}': {exc}"]
 
-    return numbers, errors
+    return parse_numbers_by_line(text, os.path.basename(path))
 
 
-def compute_mean(values: List[float]) -> float:
-    """Compute arithmetic mean."""
-    total = 0.0
+def compute_mean_and_variance(values: List[float]) -> Tuple[float, float]:
+    """Compute mean and population variance (Welford) in one pass."""
     count = 0
+    total = 0.0
+    running_mean = 0.0
+    squares = 0.0
     for value in values:
-        total += value
         count += 1
-    return total / count
+        total += value
+        delta = value - running_mean
+        running_mean += delta / count
+        squares += delta * (value - running_mean)
+
+    return total / count, squares / count
 
 
 def compute_median(sorted_values: List[float]) -> float:
@@ -98,46 +146,19 @@ def compute_median(sorted_values: List[float]) -> float:
     return (sorted_values[mid - 1] + sorted_values[mid]) / 2.0
 
 
-def compute_mode(sorted_values: List[float]) -> Optional[List[float]]:
-    """Compute mode(s)."""
-    if not sorted_values:
+def compute_mode(values: List[float]) -> Optional[List[float]]:
+    """Compute mode(s) from a frequency histogram, in ascending order."""
+    if not values:
         return None
 
-    max_count = 1
-    current = 1
-    modes: List[float] = []
-
-    for i in range(1, len(sorted_values)):
-        if sorted_values[i] == sorted_values[i - 1]:
-            current += 1
-        else:
-            if current > max_count:
-                max_count = current
-                modes = [sorted_values[i - 1]]
-            elif current == max_count and current > 1:
-                modes.append(sorted_values[i - 1])
-            current = 1
-
-    if current > max_count:
-        modes = [sorted_values[-1]]
-    elif current == max_count and current > 1:
-        modes.append(sorted_values[-1])
-
+    counts = Counter(values)
+    max_count = max(counts.values())
     if max_count == 1:
         return None
 
-    return modes
-
-
-def compute_population_variance(values: List[float], mean: float) -> float:
-    """Compute population variance."""
-    total = 0.0
-    count = 0
-    for value in values:
-        diff = value - mean
-        total += diff * diff
-        count += 1
-    return total / count
+    return sorted(
+        value for value, count in counts.items() if count == max_count
+    )
 
 
 def format_modes(modes: Optional[List[float]]) -> str:
@@ -150,9 +171,12 @@ def format_modes(modes: Optional[List[float]]) -> str:
 def list_tc_files(folder: str) -> List[str]:
     """Return sorted list of TC*.txt files."""
     files: List[str] = []
-    for name in os.listdir(folder):
-        if name.lower().startswith("tc") and name.lower().endswith(".txt"):
-            files.append(os.path.join(folder, name))
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            lower = entry.name.lower()
+            if (lower.startswith("tc") and lower.endswith(".txt")
+                    and entry.is_file()):
+                files.append(entry.path)
     files.sort()
     return files
 
@@ -179,10 +203,9 @@ def compute_statistics_for_file(path: str) -> Tuple[str, List[str]]:
 
     sorted_numbers = sorted(numbers)
 
-    mean_val = compute_mean(numbers)
+    mean_val, variance_val = compute_mean_and_variance(numbers)
     median_val = compute_median(sorted_numbers)
-    mode_val = compute_mode(sorted_numbers)
-    variance_val = compute_population_variance(numbers, mean_val)
+    mode_val = compute_mode(numbers)
     std_dev_val = math.sqrt(variance_val)
 
     section = (
@@ -12,14 +12,42 @@ Usage:
 
 from __future__ import annotations
 
+import mmap
 import os
+import re
+import stat
 import sys
 import time
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 
 HEX_DIGITS = "0123456789ABCDEF"
 
+# Translation table that turns comma separators into spaces.
+COMMA_TO_SPACE = str.maketrans(",", " ")
+
+# One value token in the raw bytes: anything between commas or whitespace.
+VALUE_TOKEN = re.compile(rb"[^,\s]+")
+
+
+def byte_to_binary_str(value: int) -> str:
+    """Convert a value in [0, 255] to an 8-digit binary string."""
+    bits: List[str] = []
+    for _ in range(8):
+        bits.append("01"[value & 1])
+        value >>= 1
+
+    bits.reverse()
+    return "".join(bits)
+
+
+# Lookup tables indexed by byte value, so conversions consume 8 bits per
+# iteration instead of one binary digit or one hex digit at a time.
+BYTE_TO_BINARY = [byte_to_binary_str(value) for value in range(256)]
+BYTE_TO_HEX = [
+    HEX_DIGITS[value >> 4] + HEX_DIGITS[value & 0xF] for value in range(256)
+]
+
 
 def get_results_file_path() -> str:
     """
@@ -52,56 +80,76 @@ def resolve_input_path(input_path: str) -> str:
 def list_tc_files(folder_path: str) -> List[str]:
     """List and sort TC*.txt files in a folder."""
     files: List[str] = []
-    for name in os.listdir(folder_path):
-        lower = name.lower()
-        if lower.startswith("tc") and lower.endswith(".txt"):
-            files.append(os.path.join(folder_path, name))
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            lower = entry.name.lower()
+            if (lower.startswith("tc") and lower.endswith(".txt")
+                    and entry.is_file()):
+                files.append(entry.path)
     files.sort()
     return files
 
 
+def parse_integers_mapped(path: str) -> Optional[List[int]]:
+    """
+    Parse a file whose tokens are all valid integers in a single pass.
+
+    The file is scanned through a read-only memory map. Returns None for
+    pipes and other non-regular files, which cannot be mapped. Raises
+    ValueError on the first invalid token (or any underscore, which int()
+    would take as a digit separator) so the caller can fall back to
+    reporting errors.
+    """
+    with open(path, "rb") as file:
+        file_stat = os.fstat(file.fileno())
+        if not stat.S_ISREG(file_stat.st_mode):
+            return None
+        if file_stat.st_size == 0:
+            return []
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if data.find(b"_") != -1:
+                raise ValueError("underscores are not valid in integers")
+            return list(map(int, VALUE_TOKEN.findall(data)))
+
+
 def parse_integers_from_file(path: str) -> Tuple[List[int], List[str]]:
     """
     Parse integer values from a file.
 
     Accepts tokens separated by whitespace and/or commas.
-    Invalid tokens are reported and skipped.
+    Files made only of valid integers take the memory-mapped fast path;
+    otherwise invalid tokens are reported and skipped.
     """
+    try:
+        mapped = parse_integers_mapped(path)
+    except (OSError, ValueError):
+        mapped = None
+
+    if mapped is not None:
+        return mapped, []
+
     numbers: List[int] = []
     errors: List[str] = []
 
+    base_name = os.path.basename(path)
+
     try:
         with open(path, "r", encoding="utf-8") as file:
-            line_no = 0
-            for raw_line in file:
-                line_no += 1
-                line = raw_line.strip()
-                if not line:
-                    continue
-
-                comma_parts = line.split(",")
-                tokens: List[str] = []
-                for part in comma_parts:
-                    tokens.extend(part.split())
-
-                for token in tokens:
-                    token_stripped = token.strip()
-                    if not token_stripped:
-                        continue
-
-                    if not is_valid_integer_token(token_stripped):
+            for line_no, raw_line in enumerate(file, start=1):
+                for token in raw_line.translate(COMMA_TO_SPACE).split():
+                    if not is_valid_integer_token(token):
                         errors.append(
-                            f"{os.path.basename(path)} - line {line_no}: "
-                            f"'{token_stripped}' skipped"
+                            f"{base_name} - line {line_no}: "
+                            f"'{token}' skipped"
                         )
                         continue
 
                     try:
-                        numbers.append(int(token_stripped))
+                        numbers.append(int(token))
                     except ValueError:
                         errors.append(
-                            f"{os.path.basename(path)} - line {line_no}: "
-                            f"'{token_stripped}' skipped"
+                            f"{base_name} - line {line_no}: "
+                            f"'{token}' skipped"
                         )
     except FileNotFoundError:
         errors.append(f"File not found: {path}")
@@ -132,7 +180,7 @@ def is_valid_integer_token(token: str) -> bool:
 
 
 def to_binary_str(number: int) -> str:
-    """Convert an integer to binary string using repeated division."""
+    """Convert an integer to binary string, one byte per shift."""
     if number == 0:
         return "0"
 
@@ -142,18 +190,17 @@ def to_binary_str(number: int) -> str:
         sign = "-"
         n = -n
 
-    bits: List[str] = []
+    chunks: List[str] = []
     while n > 0:
-        remainder = n % 2
-        bits.append("1" if remainder == 1 else "0")
-        n //= 2
+        chunks.append(BYTE_TO_BINARY[n & 0xFF])
+        n >>= 8
 
-    bits.reverse()
-    return sign + "".join(bits)
+    chunks.reverse()
+    return sign + "".join(chunks).lstrip("0")
 
 
 def to_hex_str(number: int) -> str:
-    """Convert an integer to hexadecimal string using repeated division."""
+    """Convert an integer to hexadecimal string, one byte per shift."""
     if number == 0:
         return "0"
 
@@ -163,14 +210,13 @@ def to_hex_str(number: int) -> str:
         sign = "-"
         n = -n
 
-    digits: List[str] = []
+    chunks: List[str] = []
     while n > 0:
-        remainder = n % 16
-        digits.append(HEX_DIGITS[remainder])
-        n //= 16
+        chunks.append(BYTE_TO_HEX[n & 0xFF])
+        n >>= 8
 
-    digits.reverse()
-    return sign + "".join(digits)
+    chunks.reverse()
+    return sign + "".join(chunks).lstrip("0")
 
 
 def build_section(source_label: str, rows: List[str], elapsed_seconds: float) -> str:
@@ -13,11 +13,18 @@ Usage:
 from __future__ import annotations
 
 import os
+import re
 import sys
 import time
+from collections import Counter
 from typing import Dict, List, Tuple
 
 
+# A word is any run of non-whitespace characters; compiled once so every
+# line is tokenized by the same C-level matcher.
+WORD_PATTERN = re.compile(r"\S+")
+
+
 def get_repo_root() -> str:
     """Return the repository root folder (parent of the script directory)."""
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -43,76 +50,59 @@ def resolve_input_path(input_path: str) -> str:
 def list_tc_files(folder_path: str) -> List[str]:
     """List and sort all TC*.txt files in the given folder."""
     files: List[str] = []
-    for name in os.listdir(folder_path):
-        lower = name.lower()
-        if lower.startswith("tc") and lower.endswith(".txt"):
-            files.append(os.path.join(folder_path, name))
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            lower = entry.name.lower()
+            if (lower.startswith("tc") and lower.endswith(".txt")
+                    and entry.is_file()):
+                files.append(entry.path)
     files.sort()
     return files
 
 
-def read_words_from_file(path: str) -> Tuple[List[str], List[str]]:
+def count_words_in_file(path: str) -> Tuple[Dict[str, int], List[str]]:
     """
-    Read words from a file.
+    Count word frequency in a file.
 
-    Words are separated by spaces.
+    Words are separated by whitespace and normalized to lowercase.
+    Each line's words are folded into the counts as soon as it is read,
+    so the file's full word list is never materialized.
     Empty lines are reported as errors and skipped.
 
     Returns:
-        (words, errors)
+        (counts, errors)
     """
-    words: List[str] = []
+    counts: Counter[str] = Counter()
     errors: List[str] = []
 
     try:
         with open(path, "r", encoding="utf-8") as file:
-            line_number = 0
-            for raw_line in file:
-                line_number += 1
-                line = raw_line.strip()
+            for line_number, raw_line in enumerate(file, start=1):
+                tokens = WORD_PATTERN.findall(raw_line.lower())
 
-                if line == "":
+                if not tokens:
                     errors.append(
                         f"{os.path.basename(path)} - Empty line at line {line_number}"
                     )
                     continue
 
-                tokens = line.split(" ")
-                for token in tokens:
-                    if token != "":
-                        words.append(token.lower())
+                counts.update(tokens)
     except OSError:
         errors.append(f"Error opening or reading file: {path}")
 
-    return words, errors
-
-
-def count_words(words: List[str]) -> Dict[str, int]:
-    """Count word frequency using a basic dictionary + loops algorithm."""
-    counts: Dict[str, int] = {}
-
-    for word in words:
-        if word in counts:
-            counts[word] = counts[word] + 1
-        else:
-            counts[word] = 1
-
-    return counts
+    return counts, errors
 
 
 def build_section(file_name: str, counts: Dict[str, int], elapsed: float) -> str:
     """Build a report section for one file."""
-    section = (
+    header = (
         f"\n=== Results for {file_name} ===\n"
         "Word Count Results\n"
         "------------------\n"
     )
-
-    for word, freq in counts.items():
-        section += f"{word}: {freq}\n"
-
-    section += f"Elapsed time (seconds): {elapsed}\n"
-    return section
+    rows = [f"{word}: {freq}\n" for word, freq in counts.items()]
+    footer = f"Elapsed time (seconds): {elapsed}\n"
+    return header + "".join(rows) + footer
 
 
 def write_results(result_path: str, text: str) -> None:
@@ -124,14 +114,11 @@ def write_results(result_path: str, text: str) -> None:
 def print_counts_to_console(file_name: str, errors: List[str],
                             counts: Dict[str, int], elapsed: float) -> None:
     """Print a single file's results to the console."""
-    print(f"\nFILE: {file_name}")
-    for err in errors:
-        print(f"ERROR: {err}")
-
-    for word, freq in counts.items():
-        print(f"{word} : {freq}")
-
-    print(f"Elapsed time (seconds): {elapsed}")
+    lines = [f"\nFILE: {file_name}"]
+    lines.extend(f"ERROR: {err}" for err in errors)
+    lines.extend(f"{word} : {freq}" for word, freq in counts.items())
+    lines.append(f"Elapsed time (seconds): {elapsed}")
+    print("\n".join(lines))
 
 
 def main() -> int:
@@ -155,8 +142,7 @@ def main() -> int:
 
         for file_path in tc_files:
             start = time.perf_counter()
-            words, errors = read_words_from_file(file_path)
-            counts = count_words(words)
+            counts, errors = count_words_in_file(file_path)
             elapsed = time.perf_counter() - start
 
             print_counts_to_console(
@@ -168,8 +154,7 @@ def main() -> int:
             report += build_section(os.path.basename(file_path), counts, elapsed)
     else:
         start = time.perf_counter()
-        words, errors = read_words_from_file(input_path)
-        counts = count_words(words)
+        counts, errors = count_words_in_file(input_path)
         elapsed = time.perf_counter() - start
 
         print_counts_to_console(
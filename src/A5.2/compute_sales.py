@@ -7,22 +7,64 @@ Usage:
 
 from __future__ import annotations
 
+import importlib.util
+import io
 import json
+import os
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterable, List, Optional, TextIO, Tuple
 
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 OUTPUT_FILENAME = "SalesResults.txt"
 
+# Arrow-backed strings run strip/lower as vectorized C++ kernels; fall back
+# to pandas' own string dtype when pyarrow is not installed.
+STRING_DTYPE = (
+    "string[pyarrow]" if importlib.util.find_spec("pyarrow") else "string"
+)
+
+# Per-process state filled by init_worker, so the catalogue is sent once
+# per worker instead of being pickled along with every TC task.
+WORKER_STATE: Dict[str, Any] = {}
+
 
 def load_json_file(file_path: Path) -> Any:
-    """Load and parse a JSON file."""
-    with file_path.open("r", encoding="utf-8") as file:
-        return json.load(file)
+    """
+    Load and parse a JSON file, using orjson when it is installed.
+
+    orjson rejects NaN/Infinity literals and integers beyond 64 bits that
+    the stdlib parser accepts, so such files are re-parsed with json.
+    """
+    data = file_path.read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)  # pylint: disable=no-member
+        except orjson.JSONDecodeError:  # pylint: disable=no-member
+            pass
+
+    return json.loads(data.decode("utf-8"))
+
+
+def normalize_text(column: pd.Series) -> pd.Series:
+    """Strip and lowercase a text column using pandas string kernels."""
+    return column.astype(str).astype(STRING_DTYPE).str.strip().str.lower()
+
+
+def to_categorical(values: pd.Series, categories: pd.Index) -> pd.Categorical:
+    """Encode values against shared categories, appending unseen ones."""
+    extra = pd.Index(values.dropna().unique()).difference(categories)
+    return pd.Categorical(values, categories=categories.append(extra))
 
 
 def to_dataframe_catalogue(data: Any) -> pd.DataFrame:
@@ -35,13 +77,21 @@ def to_dataframe_catalogue(data: Any) -> pd.DataFrame:
         )
 
     df = df[["title", "price"]].copy()
-    df["title"] = df["title"].astype(str).str.strip().str.lower()
+    df["title"] = normalize_text(df["title"])
     df["price"] = pd.to_numeric(df["price"], errors="coerce")
     return df
 
 
-def to_dataframe_sales(data: Any) -> pd.DataFrame:
-    """Convert sales JSON to a DataFrame."""
+def to_dataframe_sales(
+    data: Any,
+    categories: Optional[pd.Index] = None,
+) -> pd.DataFrame:
+    """
+    Convert sales JSON to a DataFrame.
+
+    When catalogue categories are given, products are encoded against them
+    so grouping and matching run on integer codes instead of strings.
+    """
     df = pd.DataFrame(data)
 
     col_map: Dict[str, str] = {}
@@ -60,16 +110,17 @@ def to_dataframe_sales(data: Any) -> pd.DataFrame:
         )
 
     df = df[["product", "quantity"]].copy()
-    df["product"] = df["product"].astype(str).str.strip().str.lower()
+    df["product"] = normalize_text(df["product"])
+    if categories is not None:
+        df["product"] = to_categorical(df["product"], categories)
     df["quantity"] = pd.to_numeric(df["quantity"], errors="coerce")
     return df
 
 
-def clean_data(
+def clean_catalogue(
     df_catalogue: pd.DataFrame,
-    df_sales: pd.DataFrame,
-) -> Tuple[pd.DataFrame, pd.DataFrame, Dict[str, pd.DataFrame]]:
-    """Validate and clean catalogue and sales data, returning errors found."""
+) -> Tuple[pd.DataFrame, Dict[str, pd.DataFrame]]:
+    """Validate and clean catalogue data, returning errors found."""
     errors: Dict[str, pd.DataFrame] = {}
 
     price_nan = df_catalogue["price"].isna()
@@ -84,6 +135,15 @@ def clean_data(
 
     df_catalogue_clean = df_catalogue[~(price_nan | price_non_pos)].copy()
 
+    return df_catalogue_clean, errors
+
+
+def clean_sales(
+    df_sales: pd.DataFrame,
+) -> Tuple[pd.DataFrame, Dict[str, pd.DataFrame]]:
+    """Validate and clean sales data, returning errors found."""
+    errors: Dict[str, pd.DataFrame] = {}
+
     qty_nan = df_sales["quantity"].isna()
     if qty_nan.any():
         errors["sales_quantity_not_numeric"] = df_sales[qty_nan].copy()
@@ -94,25 +154,46 @@ def clean_data(
 
     df_sales_clean = df_sales[~(qty_nan | qty_non_pos)].copy()
 
-    return df_catalogue_clean, df_sales_clean, errors
+    return df_sales_clean, errors
 
 
 def compute_totals(
     df_catalogue: pd.DataFrame,
     df_sales: pd.DataFrame,
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
-    """Compute total cost per product and identify missing catalogue items."""
-    sales_sum = df_sales.groupby("product", as_index=False)["quantity"].sum()
-
-    merged = sales_sum.merge(
-        df_catalogue,
-        left_on="product",
-        right_on="title",
-        how="left",
-    )
-
-    missing = merged[merged["price"].isna()].copy()
-    found = merged[~merged["price"].isna()].copy()
+    """
+    Compute total cost per product and identify missing catalogue items.
+
+    Expects the categorical product/title columns built by
+    load_base_catalogue and to_dataframe_sales.
+    """
+    sales_sum = df_sales.groupby(
+        "product",
+        observed=True,
+        sort=False,
+        as_index=False,
+    )["quantity"].sum()
+
+    # Sales products are encoded against the catalogue titles first, so a
+    # code below the number of titles is a product the catalogue lists.
+    titles = df_catalogue["title"]
+    codes = sales_sum["product"].cat.codes.to_numpy()
+    in_catalogue = codes < len(titles.cat.categories)
+
+    missing = sales_sum[~in_catalogue]
+    found = sales_sum[in_catalogue]
+
+    if len(df_catalogue) == len(titles.cat.categories):
+        # One row per title in category order: codes index prices directly.
+        found = found.assign(
+            price=df_catalogue["price"].to_numpy()[codes[in_catalogue]]
+        )
+    else:
+        # Repeated titles keep one result row per catalogue entry.
+        found = found.assign(code=codes[in_catalogue]).merge(
+            df_catalogue.assign(code=titles.cat.codes)[["code", "price"]],
+            on="code",
+        )
 
     if found.empty:
         found_df = pd.DataFrame(
@@ -120,7 +201,9 @@ def compute_totals(
         )
     else:
         found_df = found[["product", "quantity", "price"]].copy()
-        found_df["total_cost"] = found_df["quantity"] * found_df["price"]
+        # pandas.eval runs on numexpr when installed, fusing the multiply
+        # and store into one chunked, multithreaded kernel.
+        found_df.eval("total_cost = quantity * price", inplace=True)
         found_df = found_df.sort_values(by="total_cost", ascending=False)
 
     if missing.empty:
@@ -132,6 +215,11 @@ def compute_totals(
     return found_df, missing_df
 
 
+def format_money(value: float) -> str:
+    """Format a price or cost with two decimals."""
+    return f"{value:.2f}"
+
+
 def format_report(
     tc_name: str,
     detail: pd.DataFrame,
@@ -155,7 +243,12 @@ def format_report(
         total_cost = 0.0
     else:
         lines.append("RESULT (per product):")
-        lines.append(detail.to_string(index=False))
+        buffer = io.StringIO()
+        detail.assign(
+            price=detail["price"].map(format_money),
+            total_cost=detail["total_cost"].map(format_money),
+        ).to_csv(buffer, sep="\t", index=False)
+        lines.append(buffer.getvalue().rstrip("\n"))
         lines.append("")
         total_cost = float(detail["total_cost"].sum())
 
@@ -185,24 +278,36 @@ def format_report(
     return "\n".join(lines)
 
 
-def print_errors_to_console(tc_name: str, errors:
-                            Dict[str, pd.DataFrame]) -> None:
-    """Print invalid records to the console, keeping execution running."""
+def format_errors_for_console(
+    tc_name: str,
+    errors: Dict[str, pd.DataFrame],
+) -> str:
+    """Build the console summary of invalid records for a single TC."""
     if not errors:
-        return
+        return ""
 
-    print(f"\nINVALID DATA FOUND in {tc_name} (execution continues):")
+    lines: List[str] = []
+    lines.append(f"\nINVALID DATA FOUND in {tc_name} (execution continues):")
     for name, df_err in errors.items():
-        print("-" * 80)
-        print(f"{name} ({len(df_err)} rows)")
-        print(df_err.head(20).to_string(index=False))
+        lines.append("-" * 80)
+        lines.append(f"{name} ({len(df_err)} rows)")
+        lines.append(df_err.head(20).to_string(index=False))
         if len(df_err) > 20:
             remaining = len(df_err) - 20
-            print(f"... ({remaining} more rows)")
+            lines.append(f"... ({remaining} more rows)")
 
+    return "\n".join(lines) + "\n"
 
-def load_base_catalogue(base_folder: Path) -> pd.DataFrame:
-    """Load base product catalogue from TC1."""
+
+def load_base_catalogue(
+    base_folder: Path,
+) -> Tuple[pd.DataFrame, Dict[str, pd.DataFrame]]:
+    """
+    Load and clean the base product catalogue from TC1.
+
+    The catalogue is shared by every TC, so it is validated here once and
+    the invalid records are returned for inclusion in each TC report.
+    """
     tc1_folder = base_folder / "TC1"
     if not tc1_folder.exists() or not tc1_folder.is_dir():
         raise FileNotFoundError(
@@ -216,16 +321,28 @@ def load_base_catalogue(base_folder: Path) -> pd.DataFrame:
         )
 
     data = load_json_file(product_files[0])
-    return to_dataframe_catalogue(data)
-
-
-def process_tc(tc_folder: Path, df_catalogue_base: pd.DataFrame) -> str:
-    """Process a single TC folder using the base catalogue."""
+    df_cat, catalogue_errors = clean_catalogue(to_dataframe_catalogue(data))
+    cats = pd.Index(df_cat["title"].dropna().unique())
+    df_cat["title"] = pd.Categorical(df_cat["title"], categories=cats)
+    return df_cat, catalogue_errors
+
+
+def process_tc(
+    tc_folder: Path,
+    df_catalogue_base: pd.DataFrame,
+    catalogue_errors: Dict[str, pd.DataFrame],
+) -> Tuple[str, str]:
+    """
+    Process a single TC folder using the cleaned base catalogue.
+
+    Returns:
+        (console_text, report) so the caller prints both in TC order.
+    """
     tc_name = tc_folder.name
     sales_files = list(tc_folder.glob("*Sales*.json"))
 
     if not sales_files:
-        return (
+        return "", (
             "=" * 80
             + "\n"
             + f"TC: {tc_name}\n"
@@ -238,22 +355,24 @@ def process_tc(tc_folder: Path, df_catalogue_base: pd.DataFrame) -> str:
 
     try:
         sales_data = load_json_file(sales_files[0])
-        df_sales = to_dataframe_sales(sales_data)
-
-        df_cat_clean, df_sales_clean, errors = clean_data(
-            df_catalogue_base.copy(),
-            df_sales,
+        df_sales = to_dataframe_sales(
+            sales_data,
+            df_catalogue_base["title"].cat.categories,
         )
 
-        print_errors_to_console(tc_name, errors)
+        df_sales_clean, sales_errors = clean_sales(df_sales)
+        errors = {**catalogue_errors, **sales_errors}
 
-        detail, missing = compute_totals(df_cat_clean, df_sales_clean)
+        detail, missing = compute_totals(df_catalogue_base, df_sales_clean)
 
         elapsed = time.perf_counter() - start
-        return format_report(tc_name, detail, missing, errors, elapsed)
+        return (
+            format_errors_for_console(tc_name, errors),
+            format_report(tc_name, detail, missing, errors, elapsed),
+        )
 
     except (OSError, ValueError, KeyError, json.JSONDecodeError) as exc:
-        return (
+        return "", (
             "=" * 80
             + "\n"
             + f"TC: {tc_name}\n"
@@ -263,6 +382,24 @@ def process_tc(tc_folder: Path, df_catalogue_base: pd.DataFrame) -> str:
         )
 
 
+def init_worker(
+    catalogue: pd.DataFrame,
+    catalogue_errors: Dict[str, pd.DataFrame],
+) -> None:
+    """Store the cleaned base catalogue inside a worker process."""
+    WORKER_STATE["catalogue"] = catalogue
+    WORKER_STATE["catalogue_errors"] = catalogue_errors
+
+
+def process_tc_in_worker(tc_folder: Path) -> Tuple[str, str]:
+    """Process a single TC folder using the worker's base catalogue."""
+    return process_tc(
+        tc_folder,
+        WORKER_STATE["catalogue"],
+        WORKER_STATE["catalogue_errors"],
+    )
+
+
 def build_output_path(base_folder: Path) -> Path:
     """Build output path inside Output/A5.2."""
     repo_root = base_folder.parent.parent
@@ -271,6 +408,66 @@ def build_output_path(base_folder: Path) -> Path:
     return output_dir / OUTPUT_FILENAME
 
 
+def remove_temp_file(temp_path: Path) -> None:
+    """Remove a leftover temporary results file, ignoring anything else."""
+    try:
+        if temp_path.is_file():
+            temp_path.unlink()
+    except OSError:
+        pass
+
+
+def write_reports(
+    output_path: Path,
+    results: Iterable[Tuple[str, str]],
+) -> int:
+    """
+    Print every TC report and save them all to the output file.
+
+    Reports are streamed to a temporary file that replaces the previous
+    results only once every TC has been written. A file error stops the
+    saving but never the console output.
+    """
+    temp_path = output_path.with_name(output_path.name + ".tmp")
+    write_error: Optional[OSError] = None
+
+    try:
+        with ExitStack() as stack:
+            output_file: Optional[TextIO] = None
+            try:
+                output_file = stack.enter_context(
+                    temp_path.open("w", encoding="utf-8")
+                )
+            except OSError as exc:
+                write_error = exc
+
+            for index, (console_text, report) in enumerate(results):
+                print(console_text, end="")
+                print(report)
+                if output_file is None:
+                    continue
+                try:
+                    output_file.write("\n" + report if index else report)
+                except OSError as exc:
+                    output_file, write_error = None, exc
+    except OSError as exc:
+        write_error = exc
+
+    if write_error is None:
+        try:
+            temp_path.replace(output_path)
+        except OSError as exc:
+            write_error = exc
+
+    if write_error is not None:
+        print(f"ERROR: Could not write output file '{output_path}': "
+              f"{write_error}")
+        remove_temp_file(temp_path)
+        return 1
+
+    return 0
+
+
 def main(argv: List[str]) -> int:
     """Program entry point."""
     exit_code = 0
@@ -291,27 +488,28 @@ def main(argv: List[str]) -> int:
         return 1
 
     try:
-        df_catalogue_base = load_base_catalogue(base_folder)
+        catalogue, catalogue_errors = load_base_catalogue(base_folder)
     except (OSError, ValueError, FileNotFoundError) as exc:
         print(f"ERROR loading base catalogue from TC1: {exc}")
         return 1
 
-    tc_folders = [p for p in sorted(base_folder.iterdir()) if p.is_dir()]
+    with os.scandir(base_folder) as entries:
+        tc_folders = sorted(
+            Path(entry.path) for entry in entries if entry.is_dir()
+        )
     if not tc_folders:
         print("ERROR: No TC folders found inside the base folder.")
         return 1
 
-    all_reports: List[str] = []
-    for tc_folder in tc_folders:
-        report = process_tc(tc_folder, df_catalogue_base)
-        print(report)
-        all_reports.append(report)
-
-    try:
-        output_path.write_text("\n".join(all_reports), encoding="utf-8")
-    except OSError as exc:
-        print(f"ERROR: Could not write output file '{output_path}': {exc}")
-        exit_code = 1
+    with ProcessPoolExecutor(
+        max_workers=min(len(tc_folders), os.cpu_count() or 1),
+        initializer=init_worker,
+        initargs=(catalogue, catalogue_errors),
+    ) as executor:
+        exit_code = write_reports(
+            output_path,
+            executor.map(process_tc_in_worker, tc_folders),
+        )
 
     if exit_code == 0:
         print(f"All TC processed. Results saved to: {output_path}")